@@ -1,511 +1,223 @@
+import os
+
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
 
-# Sidebar for user input
-with st.sidebar:
-    st.title("Cyber Crime Analysis")
-    st.subheader("Analysis by Year and Fraud Categories")
-
-    # Button to preview the data
-    preview = st.button("Data Preview")
-
-    # Dropdown to select a year for analysis
-    years = ["2018", "2019", "2020", "2021", "2022", "Overall"]
-    selected_year = st.selectbox(
-        "Select a Year for Analysis", options=years, index=None
-    )
-
-# Main content of the dashboard
-st.title("Cyber Crime Dashboard")
-st.text("(data from data.gov.in)")
-
-# Load the dataset
-df = pd.read_csv("cyber.csv")
-
-# Clean column names by removing spaces and special characters
-df.columns = df.columns.str.strip().str.replace(" - ", "_").str.replace(" ", "_")
-
-# Fill missing values with 0
-df.fillna(0, inplace=True)
-
-if selected_year is None:
-    st.write("### Year not selected. Please select a year from the sidebar.")
+from charts import OVERALL_CHARTS, chart_spec, render_chart
+from data import (
+    category_name,
+    growth_table,
+    load_cube,
+    load_data,
+    select_cube,
+    state_names,
+    year_summary,
+)
+from notes import overall_notes, year_notes
+from timing import finish_rerun, stage, start_rerun
+from warmup import start_warmup
+
+# Every stage of this rerun is timed, see the diagnostics section in the sidebar
+start_rerun()
+
+# Optional background warm-up of every view, started once per server process
+if os.environ.get("CYBERCRIME_WARMUP"):
+    start_warmup()
+
+
+def show_chart(chart_id, cube, year=None):
+    name = chart_id if year is None else f"{chart_id}:{year}"
+    if st.session_state.get("interactive_charts"):
+        # Only the aggregated series go to the browser, which draws the chart itself
+        spec = chart_spec(chart_id, cube, year)
+        with stage(f"st.vega_lite_chart:{name}"):
+            st.vega_lite_chart(spec=spec, use_container_width=True)
+        return
+
+    # Rendering (or the cache lookup) and the transport to the browser are timed apart
+    image = render_chart(chart_id, cube, year)
+    with stage(f"st.image:{name}"):
+        st.image(image, use_container_width=True)
+
+
+def show_note(title, note):
+    # Display analysis description, views without a hand-written note show none
+    if note:
+        st.write(
+            f"""
+            **Analysis of {title}:**
+            {note}
+        """
+        )
 
-if preview:
-    st.subheader("Dataset Preview")
-    st.dataframe(df.head(10))
 
-# fraud categories to their names
-fraud_categories = {
-    "A": "Credit/Debit Card Frauds",
-    "B": "ATM Frauds",
-    "C": "Online Banking Frauds",
-    "D": "OTP Frauds",
-    "E": "Other Frauds",
+# Overall sections: section label -> chart id, headings are in OVERALL_CHARTS
+overall_sections = {
+    "Cases per Year": "year_totals",
+    "State Trends": "state_trends",
+    "Fraud Categories": "category_share",
 }
 
-if selected_year:
 
-    # Overall
-    if selected_year == "Overall":
-        # Sum total cybercrime cases for each year
-        columns_to_plot = [
-            "2018_Total",
-            "2019_Total",
-            "2020_Total",
-            "2021_Total",
-            "2022_Total",
-        ]
-        total_crimes = df[columns_to_plot].sum()
-        # 2018_Total = 10059.0
-        # 2019_Total = 18687.0
-        # 2020_Total = 31185.0
-        # 2021_Total = 42021.0
-        # 2022_Total = 52410.0
-
-        # Plot total cybercrime cases per year
-        st.subheader("Total Cybercrime Cases Per Year")
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            ["2018", "2019", "2020", "2021", "2022"],
-            total_crimes,
-            color="skyblue",
-            alpha=0.8,
-        )
-        plt.title("Total Cybercrime Cases Per Year", fontsize=16)
-        plt.ylabel("Number of Cases", fontsize=14)
-        
-        plt.xlabel("Year", fontsize=14)
-        
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            """
-            **Analysis of Total Cybercrime Cases Per Year:**
-This chart shows a sharp rise in cybercrime cases from 2018 to 2022. The number of cases has increased significantly, especially after 2019, indicating a growing trend in cyber-related crimes.        """
-        )
-
-        # Plot year-wise cybercrime trends for all states
-        st.subheader("Year-wise Cybercrime Trends for All States")
-        plt.figure(figsize=(16, 10))
-        states = df["State/UT"].unique() # Gives all states name unique because it take only one time name
-        years = ["2018", "2019", "2020", "2021", "2022"]
-        for state in states:
-            state_data = df[df["State/UT"] == state] #Filters the dataset to only include rows where State/UT matches the current state
-            values = state_data[columns_to_plot].values.flatten() # values converts the selected columns into a NumPy array and flatten convert in 1D array
-            if not values.any():  # Skip states with no data
-                continue
-            plt.plot(years, values, marker="o", label=state)
-        plt.title("Year-wise Cybercrime Trends for All States", fontsize=18)
-        plt.xlabel("Year", fontsize=14)
-        plt.ylabel("Number of Cases", fontsize=14)
-        plt.legend(loc="upper left", bbox_to_anchor=(1, 1), title="States", ncol=2)
-        
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            """
-            **Analysis of Year-wise Cybercrime Trends for All States:**
-The graph shows a sharp rise in cybercrime cases across states from 2018 to 2022, with Telangana and Maharashtra leading. While most states show an upward trend, a few remain stable. The overall surge highlights growing digital threats and reporting.        """
-        )
+def render_overall(cube, section, notes):
+    chart_id = overall_sections[section]
+    heading = OVERALL_CHARTS[chart_id]
+    st.subheader(heading)
+    show_chart(chart_id, cube)
+    show_note(heading, notes.get(chart_id))
 
-        # Pie Chart for Fraud Categories
-        st.subheader("Distribution of Cybercrime Cases by Fraud Categories")
-        category_columns = [
-            f"{year}_{i}"
-            for i in fraud_categories.keys()
-            for year in ["2018", "2019", "2020", "2021", "2022"]
-        ]  # ['2018_A', '2019_A', '2020_A', '2021_A', '2022_A', '2018_B', '2019_B', '2020_B', '2021_B', '2022_B', '2018_C', '2019_C', '2020_C', '2021_C', '2022_C', '2018_D', '2019_D', '2020_D', '2021_D', '2022_D', '2018_E', '2019_E', '2020_E', '2021_E', '2022_E']
-        total_category_cases = df[category_columns].sum()
-        # 2018_A 927.0, 2019_A 1101.0, 2020_A 3582.0, 2021_A 4872.0, 2022_A 4995.0, 2018_B 3852.0, 2019_B 6201.0, 2020_B 6480.0, 2021_B 5697.0, 2022_B 5070.0, 2018_C 2904.0, 2019_C 6279.0, 2020_C 12141.0, 2021_C 14469.0, 2022_C 19473.0, 2018_D 957.0, 2019_D 1647.0, 2020_D 3279.0, 2021_D 6084.0, 2022_D 8730.0, 2018_E 1419.0, 2019_E 3459.0, 2020_E 5703.0, 2021_E 10899.0, 2022_E 14142.0
-        fraud_summary = {
-            cat_name: total_category_cases.filter(like=cat).sum()
-            for cat, cat_name in fraud_categories.items()
-        } # {'Credit/Debit Card Frauds': np.float64(15477.0), 'ATM Frauds': np.float64(27300.0), 'Online Banking Frauds': np.float64(55266.0), 'OTP Frauds': np.float64(20697.0), 'Other Frauds': np.float64(35622.0)}
-        # Plot Pie Chart
-        plt.figure(figsize=(8, 8))
-        plt.pie(
-            fraud_summary.values(),
-            labels=fraud_summary.keys(),
-            autopct="%1.1f%%",
-            startangle=140,
-            colors=["skyblue", "lightgreen", "lightcoral", "gold", "violet"],
-        )
-        plt.title(
-            "Overall Distribution of Cybercrime Cases by Fraud Categories", fontsize=16
-        )
-        st.pyplot(plt)
 
-        # Display analysis description
-        st.write(
-            """
-            **Analysis of Distribution of Cybercrime Cases by Fraud Categories:**
-The pie chart shows that online banking frauds account for the largest share (35.8%) of cybercrimes, followed by Other Frauds (23.1%) and ATM frauds (17.7%). OTP and credit/debit card frauds make up the remaining portion.        """
-        )
+def render_year(cube, year, section, notes):
+    # One renderer for every year column found in the CSV, drawing only the open section
 
-    elif selected_year == "2018":
-        selected_year_data = df[
-            [f"2018_{cat}" for cat in fraud_categories.keys()]
-        ].sum() # 2018_A 927.0 2018_B 3852.0 2018_C 2904.0 2018_D 957.0 2018_E 1419.0
-        
+    if section == "Fraud Categories":
         # Plot total fraud cases for each category in the selected year
-        st.subheader(f"Total Fraud Cases for Each Category in 2018")
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            [fraud_categories[cat] for cat in fraud_categories.keys()],
-            selected_year_data,
-            color=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
-        )
-        plt.title(f"Total Fraud Cases in 2018", fontsize=16)
-        plt.ylabel("Number of Cases", fontsize=14)
-        plt.xlabel("Fraud Categories", fontsize=14)
-        
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of Total Fraud Cases in 2018:**
-            The graph shows that ATM Frauds had the highest cases in 2018, followed by Online Banking Frauds. Credit/Debit Card Frauds and OTP Frauds had significantly lower occurrences, while Other Frauds were moderate.
-        """
-        )
+        st.subheader(f"Total Fraud Cases for Each Category in {year}")
+        show_chart("category_totals", cube, year)
+        show_note(f"Total Fraud Cases in {year}", notes.get("categories"))
 
+    elif section == "States":
         # State-wise Fraud Cases (Bar Graph)
-        st.subheader(f"State-wise Cybercrime Cases in 2018")
-        state_data = df[["State/UT", f"2018_Total"]] # Gives 2018 total
-        state_data = state_data.sort_values(by=f"2018_Total", ascending=False) # Decending order
-        # Plot Bar Graph for State-wise Cases
-        plt.figure(figsize=(12, 8))
-        plt.barh(
-            state_data["State/UT"],
-            state_data[f"2018_Total"],
-            color="skyblue",
-            alpha=0.8,
-        )
-        plt.title(f"State-wise Cybercrime Cases in 2018", fontsize=16)
-        plt.xlabel("Number of Cases", fontsize=14)
-        plt.ylabel("State/UT", fontsize=14)
-        plt.gca().invert_yaxis()  # Invert y-axis to show highest cases on top
-       
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of State-wise Cybercrime Cases in 2018:**
-            Maharashtra and Uttar Pradesh reported the highest cybercrime cases in 2018. Other states like Odisha, Bihar, and Telangana also had significant cases, while several smaller states had minimal incidents.
-        """
-        )
+        st.subheader(f"State-wise Cybercrime Cases in {year}")
+        show_chart("state_totals", cube, year)
+        show_note(f"State-wise Cybercrime Cases in {year}", notes.get("states"))
 
+    elif section == "Top 5 States":
         # Detailed analysis per category
-        state_data = df[
-            ["State/UT"] + [f"2018_{cat}" for cat in fraud_categories.keys()]
-        ] # Gives state name and their total case in catogary(Debit Card,Online Banking...)
-        st.subheader(f"Detailed Analysis by Category in 2018")
-        for cat, cat_name in fraud_categories.items():
+        with stage(f"aggregate:{year}"):
+            summary = year_summary(cube, year) # computed once per year and shared
+        st.subheader(f"Detailed Analysis by Category in {year}")
+        for cat in cube.categories:
+            cat_name = category_name(cat)
             st.write(f"### {cat_name}")
-            top_states = (
-                state_data[["State/UT", f"2018_{cat}"]]
-                .sort_values(by=f"2018_{cat}", ascending=False)
-                .iloc[2:7]  # Skip the first two rows (totals)
+            top = pd.DataFrame(
+                summary.top_states[cat], columns=["State/UT", f"{cat_name} Cases"]
             )
-            top_states.rename(
-                columns={f"2018_{cat}": f"{cat_name} Cases"}, inplace=True
-            ) # rename column name
             st.write(f"Top 5 States with Highest {cat_name} Cases:")
-            st.table(top_states) # make table for this data
-    elif selected_year == "2019":
-        # If a specific year is selected, analyze data for that year
-        selected_year_data = df[
-            [f"2019_{cat}" for cat in fraud_categories.keys()]
-        ].sum()
+            with stage(f"st.table:{cat}"):
+                st.table(top) # make table for this data
 
-        # Plot total fraud cases for each category in the selected year
-        st.subheader(f"Total Fraud Cases for Each Category in 2019")
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            [fraud_categories[cat] for cat in fraud_categories.keys()],
-            selected_year_data,
-            color=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
-        )
-        plt.title(f"Total Fraud Cases in 2019", fontsize=16)
-        plt.ylabel("Number of Cases", fontsize=14)
-        plt.xlabel("Fraud Categories", fontsize=14)
-        
-        st.pyplot(plt)
 
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of Total Fraud Cases in 2019:**
-            In 2019, ATM and online banking fraud cases were the highest, each exceeding 6,000 cases. Other frauds also increased significantly compared to 2018, while OTP and credit/debit card frauds saw a moderate rise.
-        """
-        )
+year_sections = ["Fraud Categories", "States", "Top 5 States"]
 
-        # State-wise Fraud Cases (Bar Graph)
-        st.subheader(f"State-wise Cybercrime Cases in 2019")
-        state_data = df[["State/UT", f"2019_Total"]]
-        state_data = state_data.sort_values(by=f"2019_Total", ascending=False)
-
-        # Plot Bar Graph for State-wise Cases
-        plt.figure(figsize=(12, 8))
-        plt.barh(
-            state_data["State/UT"],
-            state_data[f"2019_Total"],
-            color="skyblue",
-            alpha=0.8,
-        )
-        plt.title(f"State-wise Cybercrime Cases in 2019", fontsize=16)
-        plt.xlabel("Number of Cases", fontsize=14)
-        plt.ylabel("State/UT", fontsize=14)
-        plt.gca().invert_yaxis()  # Invert y-axis to show highest cases on top
-       
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of State-wise Cybercrime Cases in 2019:**
-            In 2019, Maharashtra reported the highest number of cybercrime cases, followed by Bihar, Odisha, and Uttar Pradesh. Overall, cybercrime incidents increased compared to 2018.
-        """
-        )
 
-        # Detailed analysis per category
-        state_data = df[
-            ["State/UT"] + [f"2019_{cat}" for cat in fraud_categories.keys()]
-        ]
-        st.subheader(f"Detailed Analysis by Category in 2019")
-        for cat, cat_name in fraud_categories.items():
-            st.write(f"### {cat_name}")
-            top_states = (
-                state_data[["State/UT", f"2019_{cat}"]]
-                .sort_values(by=f"2019_{cat}", ascending=False)
-                .iloc[2:7]  # Skip the first two rows (totals)
-            )
-            top_states.rename(
-                columns={f"2019_{cat}": f"{cat_name} Cases"}, inplace=True
-            )
-            st.write(f"Top 5 States with Highest {cat_name} Cases:")
-            st.table(top_states)
-    elif selected_year == "2020":
-        # If a specific year is selected, analyze data for that year
-        selected_year_data = df[
-            [f"2020_{cat}" for cat in fraud_categories.keys()]
-        ].sum()
+def render_growth(cube):
+    # YoY growth, CAGR and rank changes for every State/UT and category, computed
+    # once per data version. Click a column header to sort.
+    st.subheader("Growth and Rankings")
+    year = st.selectbox("Year", cube.years[::-1], key="growth_year")
+    table = growth_table(cube, year)
 
-        # Plot total fraud cases for each category in the selected year
-        st.subheader(f"Total Fraud Cases for Each Category in 2020")
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            [fraud_categories[cat] for cat in fraud_categories.keys()],
-            selected_year_data,
-            color=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
-        )
-        plt.title(f"Total Fraud Cases in 2020", fontsize=16)
-        plt.ylabel("Number of Cases", fontsize=14)
-        plt.xlabel("Fraud Categories", fontsize=14)
-        
-        st.pyplot(plt)
+    categories = st.multiselect(
+        "Fraud categories",
+        table["Category"].unique(),
+        default=["All Categories"],
+        key="growth_categories",
+    )
+    min_cases = st.number_input("Minimum cases", min_value=0, value=0, key="growth_min")
+    # Filtering makes a new frame, the cached table is shared between sessions
+    keep = table["Category"].isin(categories) & (table[f"Cases {year}"] >= min_cases)
+    shown = table[keep]
+    st.write(
+        "Rank 1 is the selected State/UT with the most cases in the category, "
+        "tied states share a rank. Rank Change counts the places gained since "
+        "the previous year."
+    )
+    with stage(f"st.dataframe:growth:{year}"):
+        st.dataframe(shown, hide_index=True, use_container_width=True)
 
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of Total Fraud Cases in 2020:**
-            In 2020, online banking frauds saw a significant rise compared to 2019, exceeding 12,000 cases. Credit/Debit card frauds and OTP frauds also increased. This trend could be attributed to the growing reliance on digital transactions during the pandemic.
-        """
-        )
 
-        # State-wise Fraud Cases (Bar Graph)
-        st.subheader(f"State-wise Cybercrime Cases in 2020")
-        state_data = df[["State/UT", f"2020_Total"]]
-        state_data = state_data.sort_values(by=f"2020_Total", ascending=False)
-
-        # Plot Bar Graph for State-wise Cases
-        plt.figure(figsize=(12, 8))
-        plt.barh(
-            state_data["State/UT"],
-            state_data[f"2020_Total"],
-            color="skyblue",
-            alpha=0.8,
-        )
-        plt.title(f"State-wise Cybercrime Cases in 2020", fontsize=16)
-        plt.xlabel("Number of Cases", fontsize=14)
-        plt.ylabel("State/UT", fontsize=14)
-        plt.gca().invert_yaxis()  # Invert y-axis to show highest cases on top
-       
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of State-wise Cybercrime Cases in 2020:**
-            From 2019 to 2020, cybercrime cases saw a significant increase across India. In 2020, Telangana reported the highest number of cases, surpassing Maharashtra, which was leading in 2019. This rise in cybercrimes might be due to the rapid digitalization during the pandemic, which increased the attack surface for cybercriminals.
-        """
-        )
+# Load the data as a states x years x categories array, every view below is a reduction
+# over it. It is memory-mapped from the binary snapshot, cyber.csv is only parsed
+# when the snapshot is missing or the file has changed.
+cube = load_cube()
 
-        # Detailed analysis per category
-        state_data = df[
-            ["State/UT"] + [f"2020_{cat}" for cat in fraud_categories.keys()]
-        ]
-        st.subheader(f"Detailed Analysis by Category in 2020")
-        for cat, cat_name in fraud_categories.items():
-            st.write(f"### {cat_name}")
-            top_states = (
-                state_data[["State/UT", f"2020_{cat}"]]
-                .sort_values(by=f"2020_{cat}", ascending=False)
-                .iloc[2:7]  # Skip the first two rows (totals)
-            )
-            top_states.rename(
-                columns={f"2020_{cat}": f"{cat_name} Cases"}, inplace=True
-            )
-            st.write(f"Top 5 States with Highest {cat_name} Cases:")
-            st.table(top_states)
-    elif selected_year == "2021":
-        # If a specific year is selected, analyze data for that year
-        selected_year_data = df[
-            [f"2021_{cat}" for cat in fraud_categories.keys()]
-        ].sum()
+# Sidebar for user input
+with st.sidebar:
+    st.title("Cyber Crime Analysis")
+    st.subheader("Analysis by Year and Fraud Categories")
 
-        # Plot total fraud cases for each category in the selected year
-        st.subheader(f"Total Fraud Cases for Each Category in 2021")
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            [fraud_categories[cat] for cat in fraud_categories.keys()],
-            selected_year_data,
-            color=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
-        )
-        plt.title(f"Total Fraud Cases in 2021", fontsize=16)
-        plt.ylabel("Number of Cases", fontsize=14)
-        plt.xlabel("Fraud Categories", fontsize=14)
-        
-        st.pyplot(plt)
+    # Button to preview the data
+    preview = st.button("Data Preview")
 
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of Total Fraud Cases in 2021:**
-            Comparing fraud cases between 2020 and 2021, there is a noticeable increase in all categories. Online banking frauds remain the highest, with a further rise in cases. OTP frauds and other frauds have also significantly increased, suggesting that cybercriminals are adapting and exploiting new vulnerabilities.
-        """
-        )
+    # Dropdown to select a year for analysis, years are read from the CSV header.
+    # "Growth" compares every year with the previous one and with the first.
+    years = cube.years + ["Overall", "Growth"]
+    selected_year = st.selectbox(
+        "Select a Year for Analysis", options=years, index=None
+    )
 
-        # State-wise Fraud Cases (Bar Graph)
-        st.subheader(f"State-wise Cybercrime Cases in 2021")
-        state_data = df[["State/UT", f"2021_Total"]]
-        state_data = state_data.sort_values(by=f"2021_Total", ascending=False)
-
-        # Plot Bar Graph for State-wise Cases
-        plt.figure(figsize=(12, 8))
-        plt.barh(
-            state_data["State/UT"],
-            state_data[f"2021_Total"],
-            color="skyblue",
-            alpha=0.8,
-        )
-        plt.title(f"State-wise Cybercrime Cases in 2021", fontsize=16)
-        plt.xlabel("Number of Cases", fontsize=14)
-        plt.ylabel("State/UT", fontsize=14)
-        plt.gca().invert_yaxis()  # Invert y-axis to show highest cases on top
-       
-        st.pyplot(plt)
-
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of State-wise Cybercrime Cases in 2021:**
-            This graph shows state-wise cybercrime cases in 2021. Comparing this with the 2020 data, it appears that the number of cybercrime cases has increased across multiple states, with Telangana and Maharashtra continuing to report the highest numbers. This suggests a growing trend in cybercrimes, requiring stronger enforcement and cybersecurity measures.
-        """
-        )
+    # Narrow every chart and table down to some states and categories, none means all
+    selected_states = st.multiselect(
+        "States/UTs", state_names(cube), placeholder="All States/UTs"
+    )
+    selected_categories = st.multiselect(
+        "Fraud categories",
+        cube.categories,
+        format_func=category_name,
+        placeholder="All categories",
+    )
 
-        # Detailed analysis per category
-        state_data = df[
-            ["State/UT"] + [f"2021_{cat}" for cat in fraud_categories.keys()]
-        ]
-        st.subheader(f"Detailed Analysis by Category in 2021")
-        for cat, cat_name in fraud_categories.items():
-            st.write(f"### {cat_name}")
-            top_states = (
-                state_data[["State/UT", f"2021_{cat}"]]
-                .sort_values(by=f"2021_{cat}", ascending=False)
-                .iloc[2:7]  # Skip the first two rows (totals)
-            )
-            top_states.rename(
-                columns={f"2021_{cat}": f"{cat_name} Cases"}, inplace=True
-            )
-            st.write(f"Top 5 States with Highest {cat_name} Cases:")
-            st.table(top_states)
-    elif selected_year == "2022":
-        # If a specific year is selected, analyze data for that year
-        selected_year_data = df[
-            [f"2022_{cat}" for cat in fraud_categories.keys()]
-        ].sum()
+    # Draw charts in the browser instead of sending server-rendered images
+    st.toggle("Interactive charts", key="interactive_charts")
 
-        # Plot total fraud cases for each category in the selected year
-        st.subheader(f"Total Fraud Cases for Each Category in 2022")
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            [fraud_categories[cat] for cat in fraud_categories.keys()],
-            selected_year_data,
-            color=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
-        )
-        plt.title(f"Total Fraud Cases in 2022", fontsize=16)
-        plt.ylabel("Number of Cases", fontsize=14)
-        plt.xlabel("Fraud Categories", fontsize=14)
-        
-        st.pyplot(plt)
+    # Timings and cache hits of this rerun, and the process's peak memory so far
+    diagnostics = st.checkbox("Show diagnostics")
 
-        # Display analysis description
-        st.write(
-            f"""
-            **Analysis of Total Fraud Cases in 2022:**
-            This bar chart displays the total fraud cases in 2022 across different fraud categories. Compared to the 2021 data, it appears that online banking frauds and OTP frauds have significantly increased, highlighting a growing concern in digital financial security. Strengthening cybersecurity measures and increasing awareness could help mitigate these threats.
-        """
-        )
+# Main content of the dashboard
+st.title("Cyber Crime Dashboard")
+st.text("(data from data.gov.in)")
 
-        # State-wise Fraud Cases (Bar Graph)
-        st.subheader(f"State-wise Cybercrime Cases in 2022")
-        state_data = df[["State/UT", f"2022_Total"]]
-        state_data = state_data.sort_values(by=f"2022_Total", ascending=False)
-
-        # Plot Bar Graph for State-wise Cases
-        plt.figure(figsize=(12, 8))
-        plt.barh(
-            state_data["State/UT"],
-            state_data[f"2022_Total"],
-            color="skyblue",
-            alpha=0.8,
-        )
-        plt.title(f"State-wise Cybercrime Cases in 2022", fontsize=16)
-        plt.xlabel("Number of Cases", fontsize=14)
-        plt.ylabel("State/UT", fontsize=14)
-        plt.gca().invert_yaxis()  # Invert y-axis to show highest cases on top
-       
-        st.pyplot(plt)
-
-        # Display analysis description
+if selected_year is None:
+    st.write("### Year not selected. Please select a year from the sidebar.")
+
+if preview:
+    st.subheader("Dataset Preview")
+    df = load_data() # the raw table is only needed here
+    st.dataframe(df.head(10))
+
+# The selection is gathered from the cube by row and column position and cached,
+# so the views below don't know (or care) that they see a subset. The hand-written
+# notes describe the full dataset and are left out for a subset.
+filtered = bool(selected_states or selected_categories)
+with stage("filter"):
+    view = select_cube(cube, tuple(selected_states), tuple(selected_categories))
+
+if selected_year == "Growth":
+    render_growth(view)
+
+elif selected_year:
+    # Sections work like tabs, but only the open one is computed and drawn.
+    # (st.tabs would run every tab's code on each rerun.) Results stay cached,
+    # so switching back to a section is instant.
+    sections = list(overall_sections) if selected_year == "Overall" else year_sections
+    section = st.radio(
+        "Section", sections, horizontal=True, key=f"section_{selected_year}"
+    )
+
+    # Overall
+    if selected_year == "Overall":
+        render_overall(view, section, {} if filtered else overall_notes)
+
+    elif selected_year in cube.years:
+        notes = {} if filtered else year_notes.get(selected_year, {})
+        render_year(view, selected_year, section, notes)
+
+# One JSON log line per rerun, and the same numbers in the sidebar on request
+summary = finish_rerun(
+    view=selected_year,
+    data_version=cube.version,
+    states=len(selected_states),
+    categories=len(selected_categories),
+)
+if diagnostics:
+    with st.sidebar:
+        st.subheader("Diagnostics")
         st.write(
-            f"""
-            **Analysis of State-wise Cybercrime Cases in 2022:**
-            This chart represents the state-wise cybercrime cases in India for 2022. Telangana continues to report a high number of cases, similar to 2021, followed by Maharashtra, Bihar, and Andhra Pradesh.
-        """
+            f"Rerun: {summary['total_ms']:.1f} ms, "
+            f"process peak memory: {summary['process_peak_memory_mb'] or 0:.0f} MB"
+        )
+        st.dataframe(pd.DataFrame(summary["stages"], columns=["stage", "ms"]))
+        st.dataframe(
+            pd.DataFrame(list(summary["caches"].items()), columns=["cache", "result"])
         )
-
-        # Detailed analysis per category
-        state_data = df[
-            ["State/UT"] + [f"2022_{cat}" for cat in fraud_categories.keys()]
-        ]
-        st.subheader(f"Detailed Analysis by Category in 2022")
-        for cat, cat_name in fraud_categories.items():
-            st.write(f"### {cat_name}")
-            top_states = (
-                state_data[["State/UT", f"2022_{cat}"]]
-                .sort_values(by=f"2022_{cat}", ascending=False)
-                .iloc[2:7]  # Skip the first two rows (totals)
-            )
-            top_states.rename(
-                columns={f"2022_{cat}": f"{cat_name} Cases"}, inplace=True
-            )
-            st.write(f"Top 5 States with Highest {cat_name} Cases:")
-            st.table(top_states)
@@ -0,0 +1,223 @@
+"""Scale benchmark for the dashboard pipeline.
+
+Generates cyber.csv-shaped files at several scales and times each stage of the
+Overall view and of a single-year view (load, clean, aggregate, top-k, render),
+bypassing every cache. Results are written as JSON so runs can be compared:
+
+    python benchmark.py --rows 36 700 --years 5 50 --categories 5 50 --out bench.json
+
+It also measures cold start: a fresh interpreter importing the dashboard's
+modules and loading the data, up to the point where the first page can be shown.
+With --max-startup-ms the run fails when cold start is slower than that, or when
+matplotlib gets imported before any chart is drawn.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from charts import CHARTS, OVERALL_CHARTS, YEAR_CHARTS, figure_png
+from data import (
+    _load_data,
+    build_cube,
+    compute_rollups,
+    growth_stats,
+    state_trends,
+    top_states,
+    year_summary,
+)
+
+
+def category_codes(n):
+    # "A" ... "Z", then "AA", "AB", ... like spreadsheet columns
+    letters = string.ascii_uppercase
+    codes = list(letters)
+    for first, second in itertools.product(letters, repeat=2):
+        codes.append(first + second)
+    return codes[:n]
+
+
+def write_synthetic_csv(path, rows=36, years=5, categories=5, seed=0):
+    # Same layout as cyber.csv: "Sl. No.", "State/UT", then "YYYY - X" and "YYYY - Total"
+    # per year, a few "NA" rows, and the two totals rows at the end
+    rng = np.random.default_rng(seed)
+    year_labels = [str(2018 + i) for i in range(years)]
+    codes = category_codes(categories)
+    scale = rng.gamma(0.5, 200, size=(rows, 1, 1))  # a few big states, many small ones
+    counts = rng.poisson(scale * np.ones((rows, years, categories)))
+    missing = rng.random((rows, years)) < 0.02  # whole year missing, like Ladakh 2018
+
+    header = ["Sl. No.", "State/UT"]
+    for year in year_labels:
+        header += [f"{year} - {cat}" for cat in codes] + [f"{year} - Total"]
+
+    def cells(values, missing_years):
+        out = []
+        for y in range(years):
+            if missing_years[y]:
+                out += ["NA"] * (categories + 1)
+            else:
+                out += [str(v) for v in values[y]] + [str(values[y].sum())]
+        return out
+
+    no_missing = np.zeros(years, dtype=bool)
+    totals = np.where(missing[:, :, None], 0, counts).sum(axis=0)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",".join(header) + "\n")
+        for i in range(rows):
+            name = f"District {i + 1:04d}"
+            f.write(",".join([str(i + 1), name] + cells(counts[i], missing[i])) + "\n")
+        for name in ("Total State (S)", "Total (All India)"):
+            f.write(",".join([name, name] + cells(totals, no_missing)) + "\n")
+
+
+# What a fresh dashboard process does before the first chart is needed
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import streamlit, charts, data, notes, timing
+data.load_cube()
+print(time.perf_counter() - start, "matplotlib" in sys.modules)
+"""
+
+
+def measure_startup(repeat=3):
+    # Best-of-n cold start in a new interpreter, plus whether matplotlib was imported
+    here = os.path.dirname(os.path.abspath(__file__))
+    times, eager_matplotlib = [], False
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT],
+            cwd=here,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(output[-2]))
+        eager_matplotlib = eager_matplotlib or output[-1] == "True"
+    return {
+        "min": min(times),
+        "mean": sum(times) / len(times),
+        "matplotlib": eager_matplotlib,
+    }
+
+
+def timed(results, stage, func, repeat):
+    # Best-of-n wall time for one stage, returns the stage's last result
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    results[stage] = {"min": min(times), "mean": sum(times) / len(times)}
+    return value
+
+
+def bench_scale(path, repeat=3, render=True):
+    # Every call below skips the lru caches (via __wrapped__) so each repeat does real work
+    overall, year_view = {}, {}
+    df = timed(overall, "load", lambda: _load_data.__wrapped__(path, 0, 0), repeat)
+    cube = timed(overall, "clean", lambda: build_cube(df), repeat)
+    year_view["load"], year_view["clean"] = overall["load"], overall["clean"]
+
+    timed(
+        overall,
+        "aggregate",
+        lambda: (compute_rollups(cube.counts, cube.aggregate), state_trends(cube)),
+        repeat,
+    )
+    timed(overall, "growth", lambda: growth_stats.__wrapped__(cube), repeat)
+    year = cube.years[-1]
+    timed(year_view, "aggregate", lambda: year_summary.__wrapped__(cube, year), repeat)
+    timed(year_view, "topk", lambda: top_states(cube, year), repeat)
+
+    if render:
+        for chart_id in OVERALL_CHARTS:
+            timed(
+                overall, f"render:{chart_id}", lambda: figure_png(CHARTS[chart_id](cube)), 1
+            )
+        for chart_id in YEAR_CHARTS:
+            timed(
+                year_view,
+                f"render:{chart_id}",
+                lambda: figure_png(CHARTS[chart_id](cube, year)),
+                1,
+            )
+    return {"overall": overall, "year": year_view}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the dashboard pipeline at scale")
+    parser.add_argument("--rows", type=int, nargs="+", default=[36, 700])
+    parser.add_argument("--years", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--categories", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, best is kept")
+    parser.add_argument("--no-render", action="store_true", help="skip chart rendering")
+    parser.add_argument("--out", default="bench.json", help="JSON results file")
+    parser.add_argument(
+        "--max-startup-ms",
+        type=float,
+        default=None,
+        help="fail if cold start is slower than this",
+    )
+    args = parser.parse_args(argv)
+
+    startup = measure_startup(args.repeat)
+    print(
+        f"startup: {startup['min'] * 1000:.1f}ms, "
+        f"matplotlib imported: {startup['matplotlib']}"
+    )
+
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows, years, categories in itertools.product(
+            args.rows, args.years, args.categories
+        ):
+            path = os.path.join(tmp, f"cyber_{rows}x{years}x{categories}.csv")
+            write_synthetic_csv(path, rows, years, categories)
+            stages = bench_scale(path, args.repeat, render=not args.no_render)
+            runs.append(
+                {"rows": rows, "years": years, "categories": categories, "stages": stages}
+            )
+            summary = ", ".join(
+                f"{view}/{stage}={timing['min'] * 1000:.1f}ms"
+                for view, timings in stages.items()
+                for stage, timing in timings.items()
+            )
+            print(f"{rows}x{years}x{categories}: {summary}")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "startup": startup,
+                "runs": runs,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Wrote {args.out}")
+
+    if args.max_startup_ms is not None:
+        if startup["matplotlib"]:
+            sys.exit("Cold start imported matplotlib before any chart was drawn")
+        if startup["min"] * 1000 > args.max_startup_ms:
+            sys.exit(
+                f"Cold start took {startup['min'] * 1000:.1f}ms, "
+                f"limit is {args.max_startup_ms:.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from data import (
+    category_name,
+    category_totals,
+    state_trends,
+    year_summary,
+    year_totals,
+)
+from timing import cache_result, stage
+
+
+# Chart drawing: each function draws one chart of the dashboard on a new Figure.
+# Figures are created directly instead of through pyplot, so there is no global
+# figure registry to leak into and sessions on other threads never share state.
+# matplotlib is imported inside these functions, so sessions that never draw a
+# chart (no year selected, Data Preview only) never pay for importing it.
+
+
+def new_figure(figsize):
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=figsize)
+
+
+def draw_no_cases(figsize, title):
+    # Stand-in for any chart whose data is all zero, e.g. a filter down to states
+    # without cases. A pie of zeros can't be drawn at all, empty bars say nothing.
+    fig = new_figure(figsize)
+    ax = fig.subplots()
+    ax.text(
+        0.5, 0.5, "No cases for this selection", ha="center", va="center", fontsize=16
+    )
+    ax.set_axis_off()
+    ax.set_title(title, fontsize=16)
+    return fig
+
+
+def draw_year_totals(cube):
+    # Plot total cybercrime cases per year
+    totals = year_totals(cube)
+    if not totals.any():
+        return draw_no_cases((10, 6), "Total Cybercrime Cases Per Year")
+    fig = new_figure((10, 6))
+    ax = fig.subplots()
+    ax.bar(
+        cube.years,
+        totals,
+        color="skyblue",
+        alpha=0.8,
+    )
+    ax.set_title("Total Cybercrime Cases Per Year", fontsize=16)
+    ax.set_ylabel("Number of Cases", fontsize=14)
+    ax.set_xlabel("Year", fontsize=14)
+    return fig
+
+
+def draw_state_trends(cube):
+    # Plot year-wise cybercrime trends for all states
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
+    states, series = state_trends(cube) # one row of yearly totals per state
+    has_data = series.any(axis=1) # Skip states with no data
+    if not has_data.any():
+        return draw_no_cases((16, 10), "Year-wise Cybercrime Trends for All States")
+    fig = new_figure((16, 10))
+    ax = fig.subplots()
+    states = [state for state, keep in zip(states, has_data) if keep]
+    series = series[has_data]
+    # All states are drawn as one LineCollection plus one scatter for the markers,
+    # instead of one plot call (and Line2D artist) per state
+    x = np.arange(len(cube.years))
+    colors = [f"C{i % 10}" for i in range(len(states))]
+    segments = np.stack([np.broadcast_to(x, series.shape), series], axis=-1)
+    ax.add_collection(LineCollection(segments, colors=colors))
+    ax.scatter(np.tile(x, len(states)), series.ravel(), c=np.repeat(colors, len(x)))
+    ax.autoscale_view()
+    ax.set_xticks(x, cube.years)
+    # Legend entries are proxy artists, they are never drawn on the axes
+    handles = [
+        Line2D([], [], color=color, marker="o", label=state)
+        for state, color in zip(states, colors)
+    ]
+    ax.set_title("Year-wise Cybercrime Trends for All States", fontsize=18)
+    ax.set_xlabel("Year", fontsize=14)
+    ax.set_ylabel("Number of Cases", fontsize=14)
+    ax.legend(
+        handles=handles,
+        loc="upper left",
+        bbox_to_anchor=(1, 1),
+        title="States",
+        ncol=2,
+    )
+    return fig
+
+
+def draw_category_share(cube):
+    # Pie Chart for Fraud Categories, summed over all states and years
+    title = "Overall Distribution of Cybercrime Cases by Fraud Categories"
+    totals = category_totals(cube)
+    if not totals.any():
+        return draw_no_cases((8, 8), title)
+    fig = new_figure((8, 8))
+    ax = fig.subplots()
+    ax.pie(
+        totals,
+        labels=[category_name(cat) for cat in cube.categories],
+        autopct="%1.1f%%",
+        startangle=140,
+        colors=["skyblue", "lightgreen", "lightcoral", "gold", "violet"],
+    )
+    ax.set_title(title, fontsize=16)
+    return fig
+
+
+def draw_category_totals(cube, year):
+    # Plot total fraud cases for each category in the selected year
+    totals = year_summary(cube, year).category_totals
+    if not totals.any():
+        return draw_no_cases((10, 6), f"Total Fraud Cases in {year}")
+    fig = new_figure((10, 6))
+    ax = fig.subplots()
+    ax.bar(
+        [category_name(cat) for cat in cube.categories],
+        totals,
+        color=["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
+    )
+    ax.set_title(f"Total Fraud Cases in {year}", fontsize=16)
+    ax.set_ylabel("Number of Cases", fontsize=14)
+    ax.set_xlabel("Fraud Categories", fontsize=14)
+    return fig
+
+
+def draw_state_totals(cube, year):
+    # Plot Bar Graph for State-wise Cases
+    summary = year_summary(cube, year)
+    order = summary.state_order # Decending order
+    if not summary.state_totals[order].any():
+        return draw_no_cases((12, 8), f"State-wise Cybercrime Cases in {year}")
+    fig = new_figure((12, 8))
+    ax = fig.subplots()
+    ax.barh(
+        [cube.states[i] for i in order],
+        summary.state_totals[order],
+        color="skyblue",
+        alpha=0.8,
+    )
+    ax.set_title(f"State-wise Cybercrime Cases in {year}", fontsize=16)
+    ax.set_xlabel("Number of Cases", fontsize=14)
+    ax.set_ylabel("State/UT", fontsize=14)
+    ax.invert_yaxis()  # Invert y-axis to show highest cases on top
+    return fig
+
+
+# chart id -> drawing function, year charts take the year as a second argument
+CHARTS = {
+    "year_totals": draw_year_totals,
+    "state_trends": draw_state_trends,
+    "category_share": draw_category_share,
+    "category_totals": draw_category_totals,
+    "state_totals": draw_state_totals,
+}
+
+# The Overall view's charts (chart id -> heading) and the charts of every year
+# view, in dashboard order. The dashboard, the report and the warm-up all go by these.
+OVERALL_CHARTS = {
+    "year_totals": "Total Cybercrime Cases Per Year",
+    "state_trends": "Year-wise Cybercrime Trends for All States",
+    "category_share": "Distribution of Cybercrime Cases by Fraud Categories",
+}
+YEAR_CHARTS = ("category_totals", "state_totals")
+
+
+def chart_jobs(cube):
+    # (chart id, year) for every chart of every view, year is None for Overall
+    jobs = [(chart_id, None) for chart_id in OVERALL_CHARTS]
+    jobs += [(chart_id, year) for year in cube.years for chart_id in YEAR_CHARTS]
+    return jobs
+
+
+# Vega-Lite specs: the same charts drawn in the browser. Only the aggregated
+# numbers are sent (a few hundred values at most), hovering and toggling
+# states in the legend happen client-side without a rerun.
+
+
+def spec_year_totals(cube):
+    values = [
+        {"Year": year, "Cases": int(cases)}
+        for year, cases in zip(cube.years, year_totals(cube))
+    ]
+    return {
+        "title": "Total Cybercrime Cases Per Year",
+        "data": {"values": values},
+        "mark": {"type": "bar", "color": "skyblue", "tooltip": True},
+        "encoding": {
+            "x": {"field": "Year", "type": "ordinal"},
+            "y": {"field": "Cases", "type": "quantitative", "title": "Number of Cases"},
+        },
+    }
+
+
+def spec_state_trends(cube):
+    states, series = state_trends(cube)
+    values = [
+        {"State/UT": state, "Year": year, "Cases": int(cases)}
+        for state, row in zip(states, series)
+        if row.any()  # Skip states with no data
+        for year, cases in zip(cube.years, row)
+    ]
+    return {
+        "title": "Year-wise Cybercrime Trends for All States",
+        "data": {"values": values},
+        # Clicking a state in the legend isolates it (shift-click adds more)
+        "params": [
+            {
+                "name": "picked",
+                "select": {"type": "point", "fields": ["State/UT"]},
+                "bind": "legend",
+            }
+        ],
+        "mark": {"type": "line", "point": True, "tooltip": True},
+        "encoding": {
+            "x": {"field": "Year", "type": "ordinal"},
+            "y": {"field": "Cases", "type": "quantitative", "title": "Number of Cases"},
+            "color": {"field": "State/UT", "type": "nominal", "sort": None},
+            "opacity": {"condition": {"param": "picked", "value": 1}, "value": 0.1},
+        },
+    }
+
+
+def spec_category_share(cube):
+    values = [
+        {"Category": category_name(cat), "Cases": int(cases)}
+        for cat, cases in zip(cube.categories, category_totals(cube))
+    ]
+    return {
+        "title": "Overall Distribution of Cybercrime Cases by Fraud Categories",
+        "data": {"values": values},
+        "mark": {"type": "arc", "tooltip": True},
+        "encoding": {
+            "theta": {"field": "Cases", "type": "quantitative", "stack": "normalize"},
+            "color": {"field": "Category", "type": "nominal", "sort": None},
+        },
+    }
+
+
+def spec_category_totals(cube, year):
+    values = [
+        {"Category": category_name(cat), "Cases": int(cases)}
+        for cat, cases in zip(cube.categories, year_summary(cube, year).category_totals)
+    ]
+    return {
+        "title": f"Total Fraud Cases in {year}",
+        "data": {"values": values},
+        "mark": {"type": "bar", "tooltip": True},
+        "encoding": {
+            "x": {"field": "Category", "type": "nominal", "sort": None},
+            "y": {"field": "Cases", "type": "quantitative", "title": "Number of Cases"},
+            "color": {"field": "Category", "type": "nominal", "legend": None},
+        },
+    }
+
+
+def spec_state_totals(cube, year):
+    summary = year_summary(cube, year)
+    values = [
+        {"State/UT": cube.states[i], "Cases": int(summary.state_totals[i])}
+        for i in summary.state_order
+    ]
+    return {
+        "title": f"State-wise Cybercrime Cases in {year}",
+        "data": {"values": values},
+        "mark": {"type": "bar", "color": "skyblue", "tooltip": True},
+        "encoding": {
+            "y": {"field": "State/UT", "type": "nominal", "sort": "-x"},
+            "x": {"field": "Cases", "type": "quantitative", "title": "Number of Cases"},
+        },
+    }
+
+
+# chart id -> Vega-Lite spec builder, same ids and arguments as CHARTS
+SPECS = {
+    "year_totals": spec_year_totals,
+    "state_trends": spec_state_trends,
+    "category_share": spec_category_share,
+    "category_totals": spec_category_totals,
+    "state_totals": spec_state_totals,
+}
+
+
+def chart_spec(chart_id, cube, year=None):
+    # A fresh spec dict every call, Streamlit may annotate the one it is given
+    args = (cube,) if year is None else (cube, year)
+    with stage(f"spec:{chart_id if year is None else f'{chart_id}:{year}'}"):
+        return SPECS[chart_id](*args)
+
+
+class ChartCache:
+    # LRU cache of rendered chart images, bounded by entry count and total bytes.
+    # Shared by all sessions, so every access goes through the lock.
+
+    def __init__(self, max_entries=64, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image):
+        with self._lock:
+            if len(image) > self.max_bytes:
+                return  # would evict everything else, just don't keep it
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._images[key] = image
+            self._bytes += len(image)
+            # Evict least recently used images until both limits hold
+            while len(self._images) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+
+
+chart_cache = ChartCache()
+
+
+def figure_png(fig):
+    # Rasterize on a private Agg canvas, then drop the figure's artists right away
+    # rather than waiting for the garbage collector
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    try:
+        # Same output settings st.pyplot uses
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+
+def render_chart(chart_id, cube, year=None):
+    # PNG bytes for one chart. Keyed on the data version, so a replaced CSV
+    # never serves stale images; repeat views skip matplotlib entirely.
+    key = (chart_id, year, cube.version)
+    name = chart_id if year is None else f"{chart_id}:{year}"
+    image = chart_cache.get(key)
+    cache_result(f"chart:{name}", image is not None)
+    if image is None:
+        args = (cube,) if year is None else (cube, year)
+        with stage(f"render:{name}"):
+            image = figure_png(CHARTS[chart_id](*args))
+        chart_cache.put(key, image)
+    return image
@@ -0,0 +1,471 @@
+import csv
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from timing import cache_result, stage
+
+# cyber.csv lives next to this file, so the loader works from any working directory
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cyber.csv")
+
+# fraud categories to their names
+fraud_categories = {
+    "A": "Credit/Debit Card Frauds",
+    "B": "ATM Frauds",
+    "C": "Online Banking Frauds",
+    "D": "OTP Frauds",
+    "E": "Other Frauds",
+}
+
+# Rows that hold totals over other rows rather than a single State/UT
+AGGREGATE_ROWS = ("Total State (S)", "Total UT (S)", "Total (All India)")
+
+# Cleaned wide columns look like "2018_A" ... "2022_Total"
+YEAR_COLUMN = re.compile(r"^(\d{4})_(\w+)$")
+
+# Bump when the snapshot layout or the meaning of a rollup changes
+SNAPSHOT_FORMAT = 2
+
+
+# eq=False keeps identity hashing, so a cube can be used as a cache key.
+# Cubes are themselves cached per file, so one cube object means one data version.
+@dataclass(frozen=True, eq=False)
+class CrimeCube:
+    counts: np.ndarray  # cases as a dense int array of shape (states, years, categories)
+    states: list  # state names, in file order
+    years: list  # year labels such as "2018", ascending
+    categories: list  # fraud category codes such as "A"
+    state_index: dict  # state name -> positions on axis 0 (names can repeat)
+    year_index: dict  # year label -> position on axis 1
+    category_index: dict  # category code -> position on axis 2
+    aggregate: np.ndarray  # True for totals rows such as "Total (All India)"
+    version: str = ""  # hash of the source file contents
+    rollups: dict = None  # precomputed reductions, see compute_rollups()
+
+
+# Reductions computed once per cube and stored in the snapshot next to the counts
+ROLLUPS = ("year_totals", "category_totals", "state_series")
+
+
+def compute_rollups(counts, aggregate):
+    # National totals only sum real State/UT rows, the totals rows would double-count
+    states = counts[~aggregate]
+    return {
+        "year_totals": states.sum(axis=(0, 2)),  # (years,)
+        "category_totals": states.sum(axis=(0, 1)),  # (categories,)
+        "state_series": counts.sum(axis=2),  # (states, years), every row
+    }
+
+
+@dataclass(frozen=True)
+class YearSummary:
+    category_totals: np.ndarray  # cases per category, shape (categories,)
+    state_totals: np.ndarray  # cases per state, shape (states,)
+    state_order: np.ndarray  # state positions by descending total, totals rows left out
+    top_states: dict  # category -> [(state, cases), ...]
+
+
+def file_signature(path):
+    # (absolute path, modification time, size) changes whenever the CSV is replaced
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def clean_column(name):
+    # "2018 - A" -> "2018_A", "Sl. No." -> "Sl._No."
+    return name.strip().replace(" - ", "_").replace(" ", "_")
+
+
+def csv_schema(header):
+    # Declared dtypes for the cleaned column names: case counts are small nullable
+    # ints (missing cells such as Ladakh's "NA" become <NA> while parsing),
+    # State/UT is categorical and the serial number stays text ("Total UT (S)")
+    names = [clean_column(name) for name in header]
+    dtypes = {}
+    for name in names:
+        if name == "State/UT":
+            dtypes[name] = "category"
+        elif YEAR_COLUMN.match(name):
+            dtypes[name] = "Int32"
+        else:
+            dtypes[name] = "string"
+    return names, dtypes
+
+
+@lru_cache(maxsize=4)
+def _load_data(path, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key, a new file gives a new entry
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f))
+    names, dtypes = csv_schema(header)
+
+    # Single typed pass: cleaned names, dtypes and NA handling are all applied by the parser
+    with stage("csv_load"):
+        df = pd.read_csv(
+            path,
+            header=0,
+            names=names,
+            dtype=dtypes,
+            na_values=["NA", ""],
+            keep_default_na=False,
+        )
+
+    # Tag the totals rows so they are never mistaken for a State/UT
+    df["Aggregate"] = df["State/UT"].isin(AGGREGATE_ROWS)
+    return df
+
+
+def load_data(path=DATA_PATH):
+    # Parsed once per process and shared by every session and rerun.
+    # The returned frame is shared, so callers must not modify it in place.
+    hits = _load_data.cache_info().hits
+    df = _load_data(*file_signature(path))
+    cache_result("data", _load_data.cache_info().hits > hits)
+    return df
+
+
+def file_hash(path):
+    # Content hash used as the data version
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+def build_cube(df, version=""):
+    # Years and category codes come from the header, e.g. "2018_A" -> ("2018", "A")
+    years, categories = [], []
+    for column in df.columns:
+        match = YEAR_COLUMN.match(column)
+        if not match:
+            continue
+        year, cat = match.groups()
+        if year not in years:
+            years.append(year)
+        if cat != "Total" and cat not in categories:
+            categories.append(cat)
+    years.sort()
+
+    # One wide block in (year, category) order, reshaped into states x years x categories.
+    # Missing cells, and a category missing for some year, count as 0.
+    columns = [f"{year}_{cat}" for year in years for cat in categories]
+    block = df.reindex(columns=columns, fill_value=0).to_numpy(
+        dtype=np.int32, na_value=0
+    )
+    counts = block.reshape(len(df), len(years), len(categories))
+
+    states = df["State/UT"].astype(str).tolist()
+    if "Aggregate" in df:
+        aggregate = df["Aggregate"].to_numpy(dtype=bool)
+    else:
+        aggregate = np.isin(states, AGGREGATE_ROWS)
+    return make_cube(counts, states, years, categories, aggregate, version)
+
+
+def make_cube(counts, states, years, categories, aggregate, version="", rollups=None):
+    # Missing rollups are computed here, snapshots pass in their stored ones
+    if rollups is None:
+        rollups = compute_rollups(counts, aggregate)
+    for array in (counts, aggregate, *rollups.values()):
+        array.flags.writeable = False  # the cube is shared between sessions
+    state_index = {}
+    for i, state in enumerate(states):
+        state_index.setdefault(state, []).append(i)
+    return CrimeCube(
+        counts=counts,
+        states=states,
+        years=years,
+        categories=categories,
+        state_index=state_index,
+        year_index={year: i for i, year in enumerate(years)},
+        category_index={cat: i for i, cat in enumerate(categories)},
+        aggregate=aggregate,
+        version=version,
+        rollups=rollups,
+    )
+
+
+# Binary snapshot: a directory of .npy files next to the CSV ("cyber.snapshot/"),
+# memory-mapped on load so every worker process shares one page-cached copy.
+
+
+def snapshot_path(path):
+    return os.path.splitext(path)[0] + ".snapshot"
+
+
+def save_snapshot(cube, directory):
+    # Written into a temporary directory first and renamed into place, so other
+    # processes never see a half-written snapshot
+    parent = os.path.dirname(os.path.abspath(directory))
+    tmp = tempfile.mkdtemp(prefix=".snapshot-", dir=parent)
+    try:
+        arrays = {"counts": cube.counts, "aggregate": cube.aggregate, **cube.rollups}
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), array)
+        meta = {
+            "format": SNAPSHOT_FORMAT,
+            "version": cube.version,
+            "states": cube.states,
+            "years": cube.years,
+            "categories": cube.categories,
+        }
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp, directory)
+    except OSError:
+        # Read-only location or another process won the rename, keep what is there
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load_snapshot(directory, version):
+    # The snapshot cube for this data version, or None if it is missing or stale
+    try:
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != SNAPSHOT_FORMAT or meta["version"] != version:
+            return None
+
+        def mapped(name):
+            return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+
+        return make_cube(
+            mapped("counts"),
+            meta["states"],
+            meta["years"],
+            meta["categories"],
+            mapped("aggregate"),
+            version,
+            rollups={name: mapped(name) for name in ROLLUPS},
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+@lru_cache(maxsize=4)
+def _load_cube(path, mtime_ns, size):
+    # The CSV is only parsed when the snapshot is missing or its hash is stale
+    with stage("hash"):
+        version = file_hash(path)
+    directory = snapshot_path(path)
+    with stage("snapshot_load"):
+        cube = load_snapshot(directory, version)
+    cache_result("snapshot", cube is not None)
+    if cube is None:
+        df = _load_data(path, mtime_ns, size)
+        with stage("clean"):
+            cube = build_cube(df, version)
+        with stage("snapshot_save"):
+            save_snapshot(cube, directory)
+            # Switch to the mapped copy so this process shares pages with the others
+            cube = load_snapshot(directory, version) or cube
+    return cube
+
+
+def load_cube(path=DATA_PATH):
+    # Hit/miss is read from the lru counters, good enough for diagnostics
+    hits = _load_cube.cache_info().hits
+    cube = _load_cube(*file_signature(path))
+    cache_result("cube", _load_cube.cache_info().hits > hits)
+    return cube
+
+
+def category_name(cat):
+    # Codes without a known name (e.g. newly added categories) are shown as-is
+    return fraud_categories.get(cat, cat)
+
+
+# Aggregations: each one is a single reduction over one or more cube axes,
+# or a lookup of one of the precomputed rollups
+
+
+def year_totals(cube):
+    # Total cases per year, shape (years,)
+    return cube.rollups["year_totals"]
+
+
+def category_totals(cube, year=None):
+    # Cases per category for one year, or over all years when year is None
+    if year is None:
+        return cube.rollups["category_totals"]
+    return cube.counts[state_rows(cube), cube.year_index[year], :].sum(axis=0)
+
+
+def state_rows(cube):
+    # Positions of the real State/UT rows, i.e. without the totals rows
+    return np.flatnonzero(~cube.aggregate)
+
+
+def state_names(cube):
+    # Distinct State/UT names in file order, totals rows left out
+    return list(dict.fromkeys(cube.states[i] for i in state_rows(cube)))
+
+
+@lru_cache(maxsize=32)
+def select_cube(cube, states=(), categories=()):
+    # The cube restricted to some states and categories; empty means all of them.
+    # Rows and columns are gathered through the prebuilt indexes, so the cost grows
+    # with the selection, not with the dataset. Every view works on the result
+    # unchanged, and its version names the selection, keeping chart caches apart.
+    # Unknown names and totals rows raise ValueError.
+    for state in states:
+        positions = cube.state_index.get(state)
+        if positions is None:
+            raise ValueError(f"unknown state {state!r}")
+        if cube.aggregate[positions].any():
+            raise ValueError(f"{state!r} is a totals row, not a State/UT")
+    for cat in categories:
+        if cat not in cube.category_index:
+            raise ValueError(f"unknown category {cat!r}")
+    if not states and not categories:
+        return cube
+    if states:
+        rows = np.sort(np.concatenate([cube.state_index[s] for s in states]))
+    else:
+        rows = state_rows(cube)
+    if categories:
+        cols = np.sort([cube.category_index[cat] for cat in categories])
+    else:
+        cols = np.arange(len(cube.categories))
+    selection = repr(([cube.states[i] for i in rows], cols.tolist()))
+    return make_cube(
+        cube.counts[np.ix_(rows, np.arange(len(cube.years)), cols)],
+        [cube.states[i] for i in rows],
+        cube.years,
+        [cube.categories[c] for c in cols],
+        cube.aggregate[rows],
+        version=cube.version + "-" + hashlib.sha1(selection.encode()).hexdigest()[:8],
+    )
+
+
+def state_series(cube):
+    # Yearly totals per state, shape (states, years)
+    return cube.rollups["state_series"]
+
+
+def state_trends(cube):
+    # Yearly totals per distinct State/UT name, shape (names, years), totals rows left out.
+    # Rows sharing a name (e.g. district-level rows) are summed in one pass.
+    rows = state_rows(cube)
+    names, first, inverse = np.unique(
+        np.asarray(cube.states)[rows], return_index=True, return_inverse=True
+    )
+    series = np.zeros((len(names), len(cube.years)), dtype=np.int64)
+    np.add.at(series, inverse, state_series(cube)[rows])
+    order = np.argsort(first)  # keep the order the names appear in the file
+    return names[order].tolist(), series[order]
+
+
+def state_totals(cube, year):
+    # Total cases per state in one year, shape (states,)
+    return cube.counts[:, cube.year_index[year], :].sum(axis=1)
+
+
+def top_states(cube, year, k=5):
+    # Top k states per category in one year, as {category: [(state, cases), ...]}.
+    # Aggregate rows are excluded by flag, and all categories are selected at once
+    # with argpartition, so only the k winners per category ever get sorted.
+    rows = state_rows(cube)
+    values = cube.counts[rows, cube.year_index[year], :].astype(np.int64)
+    k = min(k, len(rows))
+    if k <= 0:
+        return {cat: [] for cat in cube.categories}
+
+    # Unique keys: higher cases first, then earlier rows, so ties are deterministic
+    keys = values * len(rows) + (len(rows) - 1 - np.arange(len(rows)))[:, None]
+    if k < len(rows):
+        picked = np.argpartition(-keys, k - 1, axis=0)[:k]
+    else:
+        picked = np.broadcast_to(np.arange(len(rows))[:, None], keys.shape)
+    order = np.argsort(-np.take_along_axis(keys, picked, axis=0), axis=0)
+    picked = np.take_along_axis(picked, order, axis=0)  # (k, categories), best first
+
+    return {
+        cat: [(cube.states[rows[i]], int(values[i, c])) for i in picked[:, c]]
+        for c, cat in enumerate(cube.categories)
+    }
+
+
+@lru_cache(maxsize=64)
+def year_summary(cube, year):
+    # Everything a year view needs, computed once per (cube, year) and shared by all sessions
+    totals = state_totals(cube, year)
+    rows = state_rows(cube)
+    return YearSummary(
+        category_totals=category_totals(cube, year),
+        state_totals=totals,
+        state_order=rows[np.argsort(-totals[rows], kind="stable")],
+        top_states=top_states(cube, year),
+    )
+
+
+@dataclass(frozen=True)
+class GrowthStats:
+    # All arrays are (states, years, categories + 1); the last category slot is the
+    # all-category total. Only real State/UT rows are included, see `rows`.
+    rows: np.ndarray  # cube row of each state
+    cases: np.ndarray  # cases per year
+    yoy: np.ndarray  # growth over the previous year, NaN for the first year or from 0
+    cagr: np.ndarray  # compound annual growth since the first year, NaN from 0
+    rank: np.ndarray  # 1 = most cases among all states that year, ties share a rank
+    rank_change: np.ndarray  # places gained since the previous year, 0 for the first
+
+
+@lru_cache(maxsize=8)
+def growth_stats(cube):
+    # YoY growth, CAGR and rank changes for every state, year and category at once
+    rows = state_rows(cube)
+    counts = np.asarray(cube.counts[rows], dtype=np.float64)
+    cases = np.concatenate([counts, counts.sum(axis=2, keepdims=True)], axis=2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        previous = cases[:, :-1]
+        yoy = np.full_like(cases, np.nan)
+        yoy[:, 1:] = np.where(previous > 0, cases[:, 1:] / previous - 1, np.nan)
+
+        first = cases[:, :1]
+        periods = np.arange(len(cube.years), dtype=np.float64)[None, :, None]
+        cagr = np.where(
+            (first > 0) & (periods > 0), (cases / first) ** (1 / periods) - 1, np.nan
+        )
+
+    # Competition ranking along the state axis for every (year, category) at once:
+    # tied states share a rank, so rank changes only come from real movement.
+    # Imported here, scipy.stats is slow to import and only this view needs it.
+    from scipy.stats import rankdata
+
+    rank = rankdata(-cases, method="min", axis=0).astype(np.int64)
+    rank_change = np.zeros_like(rank)
+    rank_change[:, 1:] = rank[:, :-1] - rank[:, 1:]
+
+    return GrowthStats(rows, cases, yoy, cagr, rank, rank_change)
+
+
+@lru_cache(maxsize=32)
+def growth_table(cube, year):
+    # One row per (state, category) for the given year, plus "All Categories".
+    # The frame is shared between sessions, filter or sort into a new one.
+    stats = growth_stats(cube)
+    y = cube.year_index[year]
+    names = [category_name(cat) for cat in cube.categories] + ["All Categories"]
+    n_states, n_cats = len(stats.rows), len(names)
+    return pd.DataFrame(
+        {
+            "State/UT": np.repeat([cube.states[i] for i in stats.rows], n_cats),
+            "Category": np.tile(names, n_states),
+            f"Cases {year}": stats.cases[:, y].ravel().astype(np.int64),
+            "YoY Growth %": (stats.yoy[:, y] * 100).ravel().round(1),
+            f"CAGR since {cube.years[0]} %": (stats.cagr[:, y] * 100).ravel().round(1),
+            "Rank": stats.rank[:, y].ravel(),
+            "Rank Change": stats.rank_change[:, y].ravel(),
+        }
+    )
@@ -0,0 +1,138 @@
+"""Build dashboard input from incident-level records.
+
+Streams a CSV with one row per case (state, date, fraud type) in fixed-size
+chunks and writes the state x year x category totals in the same wide layout
+as cyber.csv:
+
+    python ingest.py incidents.csv --out cyber.csv
+"""
+
+import argparse
+
+import pandas as pd
+
+from data import fraud_categories
+
+# Raw fraud-type labels -> fraud category codes, including the official category
+# names. Labels are matched after normalize_labels(); anything unmatched is "E".
+FRAUD_TYPE_LABELS = {
+    "credit card fraud": "A",
+    "debit card fraud": "A",
+    "credit debit card fraud": "A",
+    "card fraud": "A",
+    "card skimming": "A",
+    "atm fraud": "B",
+    "atm": "B",
+    "online banking fraud": "C",
+    "net banking fraud": "C",
+    "internet banking fraud": "C",
+    "upi fraud": "C",
+    "otp fraud": "D",
+    "otp": "D",
+    "other fraud": "E",
+}
+# Bare category codes ("A" ... "E") are accepted as well
+FRAUD_TYPE_LABELS.update({cat.lower(): cat for cat in fraud_categories})
+
+
+def normalize_labels(labels):
+    # "Credit/Debit Card Frauds" -> "credit debit card fraud"
+    return (
+        labels.astype(str)
+        .str.lower()
+        .str.replace(r"[^a-z0-9]+", " ", regex=True)
+        .str.strip()
+        .str.replace(r"s$", "", regex=True)
+    )
+
+
+def fraud_codes(labels):
+    # Map a column of raw labels onto category codes, unknown labels count as "E".
+    # Missing labels stay missing, so those rows are skipped like any other row
+    # with a missing field. Labels repeat heavily, so only the distinct values
+    # are normalized.
+    unique = pd.Series(labels.dropna().unique())
+    codes = normalize_labels(unique).map(FRAUD_TYPE_LABELS).fillna("E")
+    return labels.map(dict(zip(unique, codes)))
+
+
+def aggregate_incidents(
+    path,
+    state_column="state",
+    date_column="date",
+    type_column="fraud_type",
+    chunksize=100_000,
+):
+    # Running totals indexed by (state, year, category). Memory is bounded by the
+    # number of distinct combinations, never by the size of the input file.
+    totals = None
+    reader = pd.read_csv(
+        path,
+        usecols=[state_column, date_column, type_column],
+        dtype={state_column: "string", date_column: "string", type_column: "string"},
+        chunksize=chunksize,
+    )
+    for chunk in reader:
+        years = pd.to_datetime(chunk[date_column], errors="coerce", format="mixed").dt.year
+        frame = pd.DataFrame(
+            {
+                "state": chunk[state_column].str.strip(),
+                "year": years,
+                "category": fraud_codes(chunk[type_column]),
+            }
+        ).dropna()  # rows without a state, a readable date or a fraud type are skipped
+        frame["year"] = frame["year"].astype("int64")
+        counts = frame.groupby(["state", "year", "category"]).size()
+        totals = counts if totals is None else totals.add(counts, fill_value=0)
+    if totals is None:
+        return pd.Series(dtype="int64")
+    return totals.astype("int64")
+
+
+def to_wide(totals):
+    # (state, year, category) totals -> one row per State/UT with "YYYY - X" columns
+    if totals.empty:
+        return pd.DataFrame(columns=["Sl. No.", "State/UT"])
+    wide = totals.unstack(["year", "category"], fill_value=0)
+    years = sorted(wide.columns.get_level_values("year").unique())
+    columns = {}
+    for year in years:
+        for cat in fraud_categories:
+            columns[f"{year} - {cat}"] = (
+                wide[(year, cat)] if (year, cat) in wide.columns else 0
+            )
+        columns[f"{year} - Total"] = sum(
+            columns[f"{year} - {cat}"] for cat in fraud_categories
+        )
+    table = pd.DataFrame(columns, index=wide.index)
+    table.insert(0, "State/UT", table.index)
+    table.insert(0, "Sl. No.", range(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Aggregate incident-level records into dashboard input"
+    )
+    parser.add_argument("incidents", help="CSV with one row per case")
+    parser.add_argument("--out", default="cyber.csv", help="output CSV")
+    parser.add_argument("--state-column", default="state")
+    parser.add_argument("--date-column", default="date")
+    parser.add_argument("--type-column", default="fraud_type")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per chunk")
+    args = parser.parse_args(argv)
+
+    totals = aggregate_incidents(
+        args.incidents,
+        state_column=args.state_column,
+        date_column=args.date_column,
+        type_column=args.type_column,
+        chunksize=args.chunksize,
+    )
+    table = to_wide(totals)
+    table.to_csv(args.out, index=False)
+    print(f"Wrote {len(table)} states and {int(totals.sum())} cases to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
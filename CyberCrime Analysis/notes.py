@@ -0,0 +1,93 @@
+# Hand-written analysis shown under the Overall charts, keyed by chart id
+overall_notes = {
+    "year_totals": (
+        "This chart shows a sharp rise in cybercrime cases from 2018 to 2022. The "
+        "number of cases has increased significantly, especially after 2019, "
+        "indicating a growing trend in cyber-related crimes."
+    ),
+    "state_trends": (
+        "The graph shows a sharp rise in cybercrime cases across states from 2018 "
+        "to 2022, with Telangana and Maharashtra leading. While most states show an "
+        "upward trend, a few remain stable. The overall surge highlights growing "
+        "digital threats and reporting."
+    ),
+    "category_share": (
+        "The pie chart shows that online banking frauds account for the largest "
+        "share (35.8%) of cybercrimes, followed by Other Frauds (23.1%) and ATM "
+        "frauds (17.7%). OTP and credit/debit card frauds make up the remaining "
+        "portion."
+    ),
+}
+
+# Hand-written notes for the years we have analysed, years without notes just show the charts
+year_notes = {
+    "2018": {
+        "categories": (
+            "The graph shows that ATM Frauds had the highest cases in 2018, followed by "
+            "Online Banking Frauds. Credit/Debit Card Frauds and OTP Frauds had "
+            "significantly lower occurrences, while Other Frauds were moderate."
+        ),
+        "states": (
+            "Maharashtra and Uttar Pradesh reported the highest cybercrime cases in "
+            "2018. Other states like Odisha, Bihar, and Telangana also had significant "
+            "cases, while several smaller states had minimal incidents."
+        ),
+    },
+    "2019": {
+        "categories": (
+            "In 2019, ATM and online banking fraud cases were the highest, each "
+            "exceeding 2,000 cases. Other frauds also increased significantly compared "
+            "to 2018, while OTP and credit/debit card frauds saw a moderate rise."
+        ),
+        "states": (
+            "In 2019, Maharashtra reported the highest number of cybercrime cases, "
+            "followed by Bihar, Odisha, and Uttar Pradesh. Overall, cybercrime "
+            "incidents increased compared to 2018."
+        ),
+    },
+    "2020": {
+        "categories": (
+            "In 2020, online banking frauds saw a significant rise compared to 2019, "
+            "exceeding 4,000 cases. Credit/Debit card frauds and OTP frauds also "
+            "increased. This trend could be attributed to the growing reliance on "
+            "digital transactions during the pandemic."
+        ),
+        "states": (
+            "From 2019 to 2020, cybercrime cases saw a significant increase across "
+            "India. In 2020, Telangana reported the highest number of cases, surpassing "
+            "Maharashtra, which was leading in 2019. This rise in cybercrimes might be "
+            "due to the rapid digitalization during the pandemic, which increased the "
+            "attack surface for cybercriminals."
+        ),
+    },
+    "2021": {
+        "categories": (
+            "Comparing fraud cases between 2020 and 2021, there is a noticeable "
+            "increase in all categories. Online banking frauds remain the highest, with "
+            "a further rise in cases. OTP frauds and other frauds have also "
+            "significantly increased, suggesting that cybercriminals are adapting and "
+            "exploiting new vulnerabilities."
+        ),
+        "states": (
+            "This graph shows state-wise cybercrime cases in 2021. Comparing this with "
+            "the 2020 data, it appears that the number of cybercrime cases has "
+            "increased across multiple states, with Telangana and Maharashtra "
+            "continuing to report the highest numbers. This suggests a growing trend in "
+            "cybercrimes, requiring stronger enforcement and cybersecurity measures."
+        ),
+    },
+    "2022": {
+        "categories": (
+            "This bar chart displays the total fraud cases in 2022 across different "
+            "fraud categories. Compared to the 2021 data, it appears that online "
+            "banking frauds and OTP frauds have significantly increased, highlighting a "
+            "growing concern in digital financial security. Strengthening cybersecurity "
+            "measures and increasing awareness could help mitigate these threats."
+        ),
+        "states": (
+            "This chart represents the state-wise cybercrime cases in India for 2022. "
+            "Telangana continues to report a high number of cases, similar to 2021, "
+            "followed by Maharashtra, Bihar, and Andhra Pradesh."
+        ),
+    },
+}
@@ -0,0 +1,185 @@
+"""Aggregate queries over the dashboard data, importable or over local HTTP.
+
+The same numbers the dashboard shows, from the same aggregation code:
+
+    from query import run_query
+    run_query("top-states", year="2022", k=3)
+
+or as a JSON service:
+
+    python query.py --port 8502
+    curl "localhost:8502/top-states?year=2022&k=3&categories=A,C"
+
+Queries are "totals", "categories" (optionally for one year) and "top-states"
+(for one year, k states per category, default 5). Each takes optional "states"
+and "categories" filters, comma-separated in URLs. Encoded responses are cached
+per data version and carry it as their ETag, so a poll with a matching
+If-None-Match gets a 304 without any work beyond a stat() of the CSV.
+"""
+
+import argparse
+import inspect
+import json
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from data import (
+    DATA_PATH,
+    category_name,
+    category_totals,
+    load_cube,
+    select_cube,
+    state_rows,
+    top_states,
+    year_summary,
+    year_totals,
+)
+
+
+def check_year(cube, year):
+    # Years are labels such as "2018", 2018 is accepted too
+    year = str(year)
+    if year not in cube.year_index:
+        raise ValueError(f"unknown year {year!r}, expected one of {cube.years}")
+    return year
+
+
+def query_totals(cube):
+    return {"years": dict(zip(cube.years, year_totals(cube).tolist()))}
+
+
+def query_categories(cube, year=None):
+    if year is not None:
+        year = check_year(cube, year)
+    return {
+        "year": year,
+        "categories": [
+            {"code": cat, "name": category_name(cat), "cases": int(cases)}
+            for cat, cases in zip(cube.categories, category_totals(cube, year))
+        ],
+    }
+
+
+def query_top_states(cube, year, k=5):
+    year = check_year(cube, year)
+    k = int(k)
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    k = min(k, len(state_rows(cube)))  # the k actually returned, not the one asked for
+    # The dashboard's own top 5 is already cached in the year summary
+    top = year_summary(cube, year).top_states if k == 5 else top_states(cube, year, k)
+    return {
+        "year": year,
+        "k": k,
+        "top_states": {
+            cat: [{"state": state, "cases": cases} for state, cases in top[cat]]
+            for cat in cube.categories
+        },
+    }
+
+
+# query name -> function of (cube, **params)
+QUERIES = {
+    "totals": query_totals,
+    "categories": query_categories,
+    "top-states": query_top_states,
+}
+
+
+def query_cube(cube, name, states=(), categories=(), **params):
+    # One query as a JSON-ready dict; raises KeyError for an unknown query
+    # and ValueError for bad parameters
+    func = QUERIES[name]
+    try:
+        inspect.signature(func).bind(cube, **params)
+    except TypeError as error:  # missing or unexpected parameters
+        raise ValueError(str(error)) from None
+    selected = select_cube(cube, tuple(states), tuple(categories))
+    return {"query": name, "version": cube.version, **func(selected, **params)}
+
+
+def run_query(name, path=DATA_PATH, **params):
+    return query_cube(load_cube(path), name, **params)
+
+
+def etag(cube):
+    return f'"{cube.version}"'
+
+
+@lru_cache(maxsize=256)
+def encoded_response(cube, name, params):
+    # JSON bytes for one query, cached per (data version, query, parameters).
+    # params is a sorted tuple of (name, value) pairs, as in the URL.
+    kwargs = dict(params)
+    for key in ("states", "categories"):
+        if key in kwargs:
+            kwargs[key] = [value for value in kwargs[key].split(",") if value]
+    return json.dumps(query_cube(cube, name, **kwargs)).encode("utf-8")
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    data_path = DATA_PATH
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        name = url.path.strip("/")
+        if name not in QUERIES:
+            error = {"error": f"unknown query {name!r}", "queries": list(QUERIES)}
+            self.send_json(404, error)
+            return
+
+        cube = load_cube(self.data_path)
+        tag = etag(cube)
+        # Repeat polls are answered before anything is computed or even looked up
+        if_none_match = self.headers.get("If-None-Match", "")
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        if tag in tags or "*" in tags:
+            self.send_response(304)
+            self.send_header("ETag", tag)
+            self.end_headers()
+            return
+
+        query = parse_qs(url.query)
+        params = tuple(sorted((key, values[-1]) for key, values in query.items()))
+        try:
+            body = encoded_response(cube, name, params)
+        except ValueError as error:
+            self.send_json(400, {"error": str(error)})
+            return
+        self.send_body(200, body, tag)
+
+    def send_json(self, status, payload):
+        self.send_body(status, json.dumps(payload).encode("utf-8"))
+
+    def send_body(self, status, body, tag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if tag is not None:
+            self.send_header("ETag", tag)
+            self.send_header("Cache-Control", "no-cache")  # always revalidate
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve aggregate queries as JSON")
+    parser.add_argument("--csv", default=DATA_PATH, help="input CSV (default: cyber.csv)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    QueryHandler.data_path = args.csv
+    server = ThreadingHTTPServer((args.host, args.port), QueryHandler)
+    print(f"Serving {', '.join(QUERIES)} on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
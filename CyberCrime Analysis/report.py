@@ -0,0 +1,148 @@
+"""Headless report export.
+
+Renders the Overall view and every year view of the dashboard into one
+directory of PNG charts plus report.md and report.html, without Streamlit:
+
+    python report.py --out report
+"""
+
+import argparse
+import html
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from charts import OVERALL_CHARTS, chart_jobs, render_chart
+from data import DATA_PATH, category_name, load_cube, year_summary
+from notes import overall_notes, year_notes
+
+
+def chart_file(chart_id, year=None):
+    return f"{chart_id}.png" if year is None else f"{chart_id}_{year}.png"
+
+
+def _render_job(path, out_dir, chart_id, year):
+    # Runs in a worker process: each worker loads (and caches) the cube once
+    image = render_chart(chart_id, load_cube(path), year)
+    name = chart_file(chart_id, year)
+    with open(os.path.join(out_dir, name), "wb") as f:
+        f.write(image)
+    return name
+
+
+def render_charts(path, out_dir, workers=None):
+    # Every chart of every view is an independent job, spread over the process pool
+    jobs = chart_jobs(load_cube(path))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_render_job, path, out_dir, chart_id, year)
+            for chart_id, year in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def report_sections(cube):
+    # The report as a list of (heading, note, image, tables) sections,
+    # shared by the Markdown and HTML writers
+    sections = []
+    for chart_id, heading in OVERALL_CHARTS.items():
+        sections.append((heading, overall_notes.get(chart_id), chart_file(chart_id), []))
+
+    for year in cube.years:
+        notes = year_notes.get(year, {})
+        summary = year_summary(cube, year)
+        sections.append(
+            (
+                f"Total Fraud Cases for Each Category in {year}",
+                notes.get("categories"),
+                chart_file("category_totals", year),
+                [],
+            )
+        )
+        tables = []
+        for cat in cube.categories:
+            cat_name = category_name(cat)
+            top = pd.DataFrame(
+                summary.top_states[cat], columns=["State/UT", f"{cat_name} Cases"]
+            )
+            tables.append((f"Top 5 States with Highest {cat_name} Cases", top))
+        sections.append(
+            (
+                f"State-wise Cybercrime Cases in {year}",
+                notes.get("states"),
+                chart_file("state_totals", year),
+                tables,
+            )
+        )
+    return sections
+
+
+def markdown_table(df):
+    lines = ["| " + " | ".join(df.columns) + " |"]
+    lines.append("|" + "---|" * len(df.columns))
+    for row in df.itertuples(index=False):
+        lines.append("| " + " | ".join(str(value) for value in row) + " |")
+    return "\n".join(lines)
+
+
+def write_markdown(sections, filename):
+    lines = ["# Cyber Crime Report", "", "(data from data.gov.in)", ""]
+    for heading, note, image, tables in sections:
+        lines += [f"## {heading}", "", f"![{heading}]({image})", ""]
+        if note:
+            lines += [note, ""]
+        for title, table in tables:
+            lines += [f"### {title}", "", markdown_table(table), ""]
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+def write_html(sections, filename):
+    parts = [
+        "<!DOCTYPE html>",
+        '<html><head><meta charset="utf-8"><title>Cyber Crime Report</title></head>',
+        "<body>",
+        "<h1>Cyber Crime Report</h1>",
+        "<p>(data from data.gov.in)</p>",
+    ]
+    for heading, note, image, tables in sections:
+        parts.append(f"<h2>{html.escape(heading)}</h2>")
+        parts.append(
+            f'<img src="{image}" alt="{html.escape(heading)}" style="max-width:100%">'
+        )
+        if note:
+            parts.append(f"<p>{html.escape(note)}</p>")
+        for title, table in tables:
+            parts.append(f"<h3>{html.escape(title)}</h3>")
+            parts.append(table.to_html(index=False))
+    parts.append("</body></html>")
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the dashboard as a static report")
+    parser.add_argument("--csv", default=DATA_PATH, help="input CSV (default: cyber.csv)")
+    parser.add_argument("--out", default="report", help="output directory")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    os.makedirs(args.out, exist_ok=True)
+    images = render_charts(args.csv, args.out, args.workers)
+
+    sections = report_sections(load_cube(args.csv))
+    write_markdown(sections, os.path.join(args.out, "report.md"))
+    write_html(sections, os.path.join(args.out, "report.html"))
+    print(
+        f"Wrote {len(images)} charts and report.md/report.html to {args.out} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
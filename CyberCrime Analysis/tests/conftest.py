@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The dashboard's modules import each other as top-level modules (streamlit run
+# puts the script's directory on sys.path), so the tests do the same
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
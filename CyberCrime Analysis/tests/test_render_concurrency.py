@@ -0,0 +1,98 @@
+import json
+import os
+import subprocess
+import sys
+
+from charts import CHARTS, chart_jobs
+from data import load_cube
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Renders every chart of every view from a thread pool, round after round, the
+# way concurrent sessions do. Straight to matplotlib: the chart cache would turn
+# every repeat into a lookup. Prints one JSON line of results.
+RENDER_SCRIPT = """
+import gc, json, os, sys
+from concurrent.futures import ThreadPoolExecutor
+from charts import CHARTS, chart_jobs, figure_png
+from data import load_cube
+from matplotlib.figure import Figure
+
+def render(job):
+    chart_id, year = job
+    args = (cube,) if year is None else (cube, year)
+    return figure_png(CHARTS[chart_id](*args))
+
+def live_figures():
+    gc.collect()
+    return sum(isinstance(obj, Figure) for obj in gc.get_objects())
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return None
+
+cube = load_cube()
+jobs = chart_jobs(cube)
+expected = [render(job) for job in jobs]
+figures = live_figures()
+identical, rss = True, []
+with ThreadPoolExecutor(max_workers=%(threads)d) as pool:
+    for _ in range(%(rounds)d):
+        identical = identical and list(pool.map(render, jobs)) == expected
+        gc.collect()
+        rss.append(rss_mb())
+print(json.dumps({
+    "identical": identical,
+    "pyplot": "matplotlib.pyplot" in sys.modules,
+    "figures": [figures, live_figures()],
+    "rss_mb": rss,
+}))
+"""
+
+THREADS = 8
+WARMUP_ROUNDS = 2
+MEASURED_ROUNDS = 4
+MAX_GROWTH_MB = 50
+
+
+def run_rounds():
+    # glibc hands large blocks back to the OS only below its mmap threshold, which
+    # otherwise rises with every big free. Pinning it (ignored elsewhere) keeps
+    # freed Agg buffers out of RSS, so RSS tracks what is actually still alive.
+    env = {**os.environ, "MALLOC_MMAP_THRESHOLD_": str(1024 * 1024)}
+    script = RENDER_SCRIPT % {
+        "threads": THREADS,
+        "rounds": WARMUP_ROUNDS + MEASURED_ROUNDS,
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_every_chart_is_rendered():
+    cube = load_cube()
+    assert {chart_id for chart_id, _ in chart_jobs(cube)} == set(CHARTS)
+
+
+def test_concurrent_rendering_is_identical_and_does_not_leak():
+    result = run_rounds()
+    assert result["identical"]
+    assert not result["pyplot"]
+    before, after = result["figures"]
+    assert after == before
+
+    rss = result["rss_mb"]
+    if rss[0] is not None:  # /proc is Linux only
+        # A leaked figure keeps its Agg buffer, tens of MB at dpi 200, so a leak
+        # grows RSS by hundreds of MB over the measured rounds
+        warm = rss[WARMUP_ROUNDS - 1]
+        assert max(rss[WARMUP_ROUNDS:]) - warm < MAX_GROWTH_MB, rss
@@ -0,0 +1,11 @@
+from benchmark import measure_startup
+
+# Cold start is well under a second on a laptop, mostly importing streamlit.
+# The limit only has to catch something heavy landing on the startup path.
+MAX_STARTUP_S = 3.0
+
+
+def test_cold_start():
+    startup = measure_startup(repeat=3)
+    assert not startup["matplotlib"], "matplotlib was imported before any chart"
+    assert startup["min"] < MAX_STARTUP_S, startup
@@ -0,0 +1,96 @@
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+# One JSON line per dashboard rerun is written to this logger
+logger = logging.getLogger("cybercrime.timing")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Streamlit runs each session's script on its own thread, so the active
+# timer is per thread. Outside a rerun (report, benchmark) stage() is a no-op.
+_local = threading.local()
+
+
+def process_peak_memory_mb():
+    # Peak resident memory over the whole life of the process (not just one rerun),
+    # None where the platform can't tell
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB on Linux and the BSDs
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+class RerunTimer:
+    # Collects stage timings and cache hits/misses for one rerun
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = []  # (stage name, seconds), in the order they ran
+        self.caches = {}  # cache name -> "hit" / "miss"
+
+    def record(self, name, seconds):
+        self.stages.append((name, seconds))
+
+    def cache(self, name, hit):
+        self.caches[name] = "hit" if hit else "miss"
+
+    def summary(self):
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "stages": [
+                {"stage": name, "ms": round(seconds * 1000, 2)}
+                for name, seconds in self.stages
+            ],
+            "caches": self.caches,
+            "process_peak_memory_mb": process_peak_memory_mb(),
+        }
+
+
+def start_rerun():
+    # Begin timing a rerun on this thread, replacing any unfinished one
+    _local.timer = RerunTimer()
+    return _local.timer
+
+
+def finish_rerun(**fields):
+    # Stop timing and log the rerun as one JSON line; returns the summary
+    timer = getattr(_local, "timer", None)
+    _local.timer = None
+    if timer is None:
+        return None
+    summary = {**fields, **timer.summary()}
+    logger.info(json.dumps(summary))
+    return summary
+
+
+@contextmanager
+def stage(name):
+    timer = getattr(_local, "timer", None)
+    if timer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.record(name, time.perf_counter() - start)
+
+
+def cache_result(name, hit):
+    timer = getattr(_local, "timer", None)
+    if timer is not None:
+        timer.cache(name, hit)
@@ -0,0 +1,116 @@
+"""Background cache warm-up.
+
+Loads the data, precomputes the aggregates and renders the Overall view and
+every year view into the shared chart cache on a thread pool, so the first
+visitor after a restart gets cached pages. Start the dashboard through this
+script to warm up while the server starts (extra options go to streamlit run):
+
+    python warmup.py --server.port 8501
+
+or set CYBERCRIME_WARMUP=1 for `streamlit run Crime.py`, which starts the
+warm-up on the first page load instead. Progress is logged as JSON lines.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from charts import chart_jobs, render_chart
+from data import (
+    DATA_PATH,
+    growth_table,
+    load_cube,
+    load_data,
+    state_trends,
+    year_summary,
+)
+from timing import logger
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Crime.py")
+
+_started = False
+_lock = threading.Lock()
+
+
+def log(event, **fields):
+    logger.info(json.dumps({"warmup": event, **fields}))
+
+
+def warm_up(path=DATA_PATH, workers=4):
+    # Fill the data, aggregate and chart caches; returns the number of charts rendered
+    start = time.perf_counter()
+    cube = load_cube(path)
+    load_data(path)  # Data Preview
+    log("data", ms=round((time.perf_counter() - start) * 1000, 2), version=cube.version)
+
+    step = time.perf_counter()
+    state_trends(cube)
+    for year in cube.years:
+        year_summary(cube, year)
+        growth_table(cube, year)
+    log("aggregates", ms=round((time.perf_counter() - step) * 1000, 2))
+
+    def render(chart_id, year):
+        began = time.perf_counter()
+        render_chart(chart_id, cube, year)
+        return time.perf_counter() - began
+
+    jobs = chart_jobs(cube)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as pool:
+        futures = {
+            pool.submit(render, chart_id, year): (chart_id, year)
+            for chart_id, year in jobs
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            chart_id, year = futures[future]
+            name = chart_id if year is None else f"{chart_id}:{year}"
+            try:
+                seconds = future.result()
+            except Exception as error:  # one broken chart shouldn't stop the rest
+                log("chart", chart=name, done=done, total=len(jobs), error=repr(error))
+                continue
+            ms = round(seconds * 1000, 2)
+            log("chart", chart=name, done=done, total=len(jobs), ms=ms)
+
+    total_ms = round((time.perf_counter() - start) * 1000, 2)
+    log("done", charts=len(jobs), total_ms=total_ms)
+    return len(jobs)
+
+
+def start_warmup(path=DATA_PATH, workers=4):
+    # Run warm_up() on a daemon thread, at most once per process
+    global _started
+    with _lock:
+        if _started:
+            return None
+        _started = True
+
+    def run():
+        try:
+            warm_up(path, workers)
+        except Exception as error:  # the dashboard still works, just cold
+            log("failed", error=repr(error))
+
+    thread = threading.Thread(target=run, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def main(argv=None):
+    # Same process as the server, so the caches warmed here are the ones it serves from
+    from streamlit.web import cli
+
+    argv = sys.argv[1:] if argv is None else argv
+    start_warmup()
+    # This file runs as __main__ here, Crime.py's "import warmup" would get a second
+    # copy that doesn't know a warm-up is already running
+    os.environ.pop("CYBERCRIME_WARMUP", None)
+    sys.argv = ["streamlit", "run", APP_PATH, *argv]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()